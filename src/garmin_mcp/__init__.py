@@ -5,8 +5,11 @@ Modular MCP Server for Garmin Connect Data
 import os
 import sys
 import base64
+import http.cookiejar
+import threading
 
 import requests
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP
 
 from garminconnect import Garmin, GarminConnectAuthenticationError, GarminConnectConnectionError, GarminConnectTooManyRequestsError
@@ -29,6 +32,26 @@ from garmin_mcp import workout_builders
 from garmin_mcp import courses
 from garmin_mcp import activity_analysis
 
+# Tool modules, in registration order. Each exposes configure(client) and
+# register_tools(app).
+_TOOL_MODULES = (
+    activity_management,
+    health_wellness,
+    user_profile,
+    devices,
+    gear_management,
+    weight_management,
+    challenges,
+    training,
+    workouts,
+    data_management,
+    womens_health,
+    nutrition,
+    workout_builders,
+    courses,
+    activity_analysis,
+)
+
 
 def is_interactive_terminal() -> bool:
     """Detect if running in interactive terminal vs MCP subprocess.
@@ -148,6 +171,64 @@ class _GarminProxy:
         return _call
 
 
+def _reuse_api_session(garmin) -> None:
+    """Serve every Connect API call from one long-lived, pooled HTTP session.
+
+    garminconnect builds a fresh requests.Session for each API call, so every
+    tool call pays a new TCP connect and TLS handshake. Swapping in a single
+    session keeps connections alive across calls. Cookies are blocked so the
+    shared session behaves like the per-call ones the library expects; auth
+    travels in explicit headers. Only idempotent GETs are retried.
+    """
+    client = getattr(garmin, "client", None)
+    if not hasattr(client, "_fresh_api_session"):
+        return  # library internals changed; keep its default behaviour
+
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries),
+    )
+    client._fresh_api_session = lambda: session
+
+
+def _serialize_token_refresh(garmin) -> None:
+    """Let only one thread refresh the auth token at a time.
+
+    Tools run blocking Garmin calls in worker threads, so several requests can
+    find the token about to expire (or get a 401) at once. garminconnect
+    refreshes and rewrites the token store without locking, which would race.
+    Calls that queued behind a refresh reuse its result instead of refreshing
+    again.
+    """
+    client = getattr(garmin, "client", None)
+    refresh = getattr(client, "_refresh_session", None)
+    if refresh is None:
+        return  # library internals changed; keep its default behaviour
+
+    lock = threading.Lock()
+    generation = 0
+
+    def _locked_refresh() -> None:
+        nonlocal generation
+        seen = generation
+        with lock:
+            if generation != seen:
+                return  # another thread refreshed while this one waited
+            refresh()
+            generation += 1
+
+    client._refresh_session = _locked_refresh
+
+
 def _parse_transport_config() -> tuple[str, str, int]:
     """Read and validate HTTP transport env vars. Raises ValueError on bad input."""
     transport = os.getenv("GARMIN_MCP_TRANSPORT", "stdio").strip().lower()
@@ -363,25 +444,17 @@ def main():
 
     print("Garmin Connect client initialized successfully.", file=sys.stderr)
 
+    # Keep HTTP connections to Garmin alive across tool calls, and refresh
+    # the token from one worker thread at a time
+    _reuse_api_session(garmin_client)
+    _serialize_token_refresh(garmin_client)
+
     # Wrap client so runtime auth/rate-limit errors surface as clear messages
     garmin_client = _GarminProxy(garmin_client)
 
     # Configure all modules with the Garmin client
-    activity_management.configure(garmin_client)
-    health_wellness.configure(garmin_client)
-    user_profile.configure(garmin_client)
-    devices.configure(garmin_client)
-    gear_management.configure(garmin_client)
-    weight_management.configure(garmin_client)
-    challenges.configure(garmin_client)
-    training.configure(garmin_client)
-    workouts.configure(garmin_client)
-    data_management.configure(garmin_client)
-    womens_health.configure(garmin_client)
-    nutrition.configure(garmin_client)
-    workout_builders.configure(garmin_client)
-    courses.configure(garmin_client)
-    activity_analysis.configure(garmin_client)
+    for module in _TOOL_MODULES:
+        module.configure(garmin_client)
 
     # Create the MCP app, wrapped so the env-var filter can drop tools.
     # host/port only matter for the HTTP transports; stdio ignores them.
@@ -393,21 +466,8 @@ def main():
         print(f"Tool filter: denylist of {len(disabled_tools)} tool(s).", file=sys.stderr)
 
     # Register tools from all modules
-    app = activity_management.register_tools(app)
-    app = health_wellness.register_tools(app)
-    app = user_profile.register_tools(app)
-    app = devices.register_tools(app)
-    app = gear_management.register_tools(app)
-    app = weight_management.register_tools(app)
-    app = challenges.register_tools(app)
-    app = training.register_tools(app)
-    app = workouts.register_tools(app)
-    app = data_management.register_tools(app)
-    app = womens_health.register_tools(app)
-    app = nutrition.register_tools(app)
-    app = workout_builders.register_tools(app)
-    app = courses.register_tools(app)
-    app = activity_analysis.register_tools(app)
+    for module in _TOOL_MODULES:
+        app = module.register_tools(app)
 
     # Register resources (workout templates)
     app = workout_templates.register_resources(app)
@@ -1,28 +1,167 @@
 """
 Nutrition/food logging functions for Garmin Connect MCP Server
 """
-import json
+import asyncio
+import operator
+from datetime import datetime, timezone
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 from garminconnect import GarminConnectConnectionError
 
+from garmin_mcp.response_cache import TTLCache
+from garmin_mcp.serialization import to_json
+from garmin_mcp.workouts import _validate_date
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
+# Read-only GET responses, keyed by URL. Agents often re-read the same day's
+# log or meals several times within one conversation.
+_SERVING_UNITS_CACHE_TTL = 24 * 60 * 60  # metadata, effectively static
+_response_cache = TTLCache(ttl=15, max_entries=256)
+
 
 def _num_to_str(value: float) -> str:
     """Format a number as string, dropping .0 for whole numbers.
 
     Garmin's API expects integer strings like "160" not "160.0".
     """
-    return str(int(value)) if value == int(value) else str(value)
+    if isinstance(value, int):
+        return str(value)
+    int_value = int(value)
+    return str(int_value) if int_value == value else str(value)
+
+
+def _log_timestamp() -> str:
+    """Current UTC time in the millisecond ISO format Garmin's food log expects."""
+    now = datetime.now(timezone.utc)
+    return f"{now:%Y-%m-%dT%H:%M:%S}.000Z"
+
+
+# Constant fields shared by every custom-food and regular food-log payload.
+_FOOD_META_BASE = {
+    "foodType": "GENERIC",
+    "source": "GARMIN",
+    "regionCode": "US",
+    "languageCode": "en",
+}
+_FOOD_LOG_ITEM_BASE = {
+    "logSource": "GCW",
+    "logCategory": "REGULAR_LOG",
+    "action": "ADD",
+    "source": "GARMIN",
+    "regionCode": "US",
+    "languageCode": "en",
+}
+
+
+# Garmin API field name -> tool parameter name for optional nutrient values.
+_OPTIONAL_NUTRIENT_FIELDS = (
+    ("carbs", "carbs"),
+    ("protein", "protein"),
+    ("fat", "fat"),
+    ("fiber", "fiber"),
+    ("sugar", "sugar"),
+    ("saturatedFat", "saturated_fat"),
+    ("sodium", "sodium"),
+    ("cholesterol", "cholesterol"),
+    ("potassium", "potassium"),
+    ("transFat", "trans_fat"),
+    ("calcium", "calcium"),
+    ("iron", "iron"),
+    ("vitaminD", "vitamin_d"),
+)
+_OPTIONAL_NUTRIENT_KEYS = frozenset(api_key for api_key, _ in _OPTIONAL_NUTRIENT_FIELDS)
+_OPTIONAL_NUTRIENT_PARAMS = frozenset(name for _, name in _OPTIONAL_NUTRIENT_FIELDS)
+
+
+def _optional_nutrients(**values: Optional[float]) -> dict:
+    """Map the caller-supplied optional nutrient params to API fields.
+
+    Takes nutrient values by parameter name and skips the ones that are None
+    (not supplied by the caller). Tools that accept only some nutrients pass
+    only those.
+    """
+    unknown = values.keys() - _OPTIONAL_NUTRIENT_PARAMS
+    if unknown:
+        raise TypeError(f"Unknown nutrient parameters: {', '.join(sorted(unknown))}")
+    return {
+        api_key: _num_to_str(values[name])
+        for api_key, name in _OPTIONAL_NUTRIENT_FIELDS
+        if values.get(name) is not None
+    }
+
+
+_response_text = operator.attrgetter("error.response.text")
+
+
+def _error_body(e: Exception) -> str:
+    """Return the HTTP response body wrapped by a Garmin connection error, if any."""
+    try:
+        return _response_text(e)
+    except AttributeError:
+        return ""
+
+
+_CUSTOM_FOOD_PATH = "/nutrition-service/customFood"
+_FOOD_LOGS_PATH = "/nutrition-service/food/logs"
+
+# Per-date/per-id endpoints, bound once so each call is a single format.
+_food_log_url = (_FOOD_LOGS_PATH + "/{}").format
+_meals_url = "/nutrition-service/meals/{}".format
+_settings_url = "/nutrition-service/settings/{}".format
+_custom_food_url = (_CUSTOM_FOOD_PATH + "/{}").format
+
+
+def _custom_food_search_url(search: str, start: int, limit: int) -> str:
+    """Build the customFood search URL, omitting an empty search expression."""
+    params = {"searchExpression": search} if search else {}
+    params.update(start=start, limit=limit, includeContent="true")
+    return f"{_CUSTOM_FOOD_PATH}?{urlencode(params, quote_via=quote)}"
+
+
+def _match_meal_id(meals: list, meal_time: str):
+    """Pick the meal whose startTime/endTime window contains meal_time.
+
+    Falls back to the SNACKS meal; returns None if neither matches.
+    """
+    for m in meals:
+        start = m.get("startTime")
+        end = m.get("endTime")
+        if start and end and start <= meal_time <= end:
+            return m["mealId"]
+    snacks = next((m for m in meals if m.get("mealName") == "SNACKS"), None)
+    return snacks["mealId"] if snacks is not None else None
+
+
+async def _cached_connectapi(url: str, ttl: Optional[float] = None):
+    """Fetch a GET endpoint, reusing a recent response for the same URL."""
+    cached = _response_cache.get(url)
+    if cached is not None:
+        return cached
+    # A write may clear the cache while this fetch runs in its worker thread;
+    # the generation check keeps the pre-write response out of the cache.
+    generation = _response_cache.generation
+    data = await asyncio.to_thread(garmin_client.connectapi, url)
+    return _response_cache.put(url, data, ttl, generation)
 
 
 def configure(client):
     """Configure the module with the Garmin client instance"""
     global garmin_client
+    if client is garmin_client:
+        return
     garmin_client = client
+    _response_cache.clear()
+
+
+def invalidate_response_cache() -> None:
+    """Forget cached nutrition API responses.
+
+    Called after every food, meal or log write.
+    """
+    _response_cache.clear()
 
 
 def register_tools(app):
@@ -39,11 +178,12 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            url = f"/nutrition-service/food/logs/{date}"
-            data = garmin_client.connectapi(url)
+            _validate_date(date)
+            url = _food_log_url(date)
+            data = await _cached_connectapi(url)
             if not data:
                 return f"No food log data found for {date}."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving food log data: {str(e)}"
 
@@ -59,11 +199,12 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            url = f"/nutrition-service/meals/{date}"
-            data = garmin_client.connectapi(url)
+            _validate_date(date)
+            url = _meals_url(date)
+            data = await _cached_connectapi(url)
             if not data:
                 return f"No meal data found for {date}."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving meal data: {str(e)}"
 
@@ -78,11 +219,12 @@ def register_tools(app):
             date: Date in YYYY-MM-DD format
         """
         try:
-            url = f"/nutrition-service/settings/{date}"
-            data = garmin_client.connectapi(url)
+            _validate_date(date)
+            url = _settings_url(date)
+            data = await _cached_connectapi(url)
             if not data:
                 return f"No nutrition settings found for {date}."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving nutrition settings: {str(e)}"
 
@@ -104,16 +246,11 @@ def register_tools(app):
             limit: Maximum number of results (default 20)
         """
         try:
-            url = (
-                f"/nutrition-service/customFood"
-                f"?searchExpression={quote(search)}"
-                f"&start={start}&limit={limit}"
-                f"&includeContent=true"
-            )
-            data = garmin_client.connectapi(url)
+            url = _custom_food_search_url(search, start, limit)
+            data = await _cached_connectapi(url)
             if not data:
                 return "No custom foods found."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving custom foods: {str(e)}"
 
@@ -126,10 +263,10 @@ def register_tools(app):
         """
         try:
             url = "/nutrition-service/metadata/customFoodServingUnits"
-            data = garmin_client.connectapi(url)
+            data = await _cached_connectapi(url, ttl=_SERVING_UNITS_CACHE_TTL)
             if not data:
                 return "No serving units found."
-            return json.dumps(data, indent=2)
+            return to_json(data)
         except Exception as e:
             return f"Error retrieving serving units: {str(e)}"
 
@@ -190,34 +327,25 @@ def register_tools(app):
                 "servingUnit": serving_unit,
                 "numberOfUnits": _num_to_str(number_of_units),
                 "calories": _num_to_str(calories),
+                # Only include optional fields that have values
+                **_optional_nutrients(
+                    carbs=carbs,
+                    protein=protein,
+                    fat=fat,
+                    fiber=fiber,
+                    sugar=sugar,
+                    saturated_fat=saturated_fat,
+                    sodium=sodium,
+                    cholesterol=cholesterol,
+                    potassium=potassium,
+                    trans_fat=trans_fat,
+                    calcium=calcium,
+                    iron=iron,
+                    vitamin_d=vitamin_d,
+                ),
             }
-            # Only include optional fields that have values
-            optional_fields = {
-                "carbs": carbs,
-                "protein": protein,
-                "fat": fat,
-                "fiber": fiber,
-                "sugar": sugar,
-                "saturatedFat": saturated_fat,
-                "sodium": sodium,
-                "cholesterol": cholesterol,
-                "potassium": potassium,
-                "transFat": trans_fat,
-                "calcium": calcium,
-                "iron": iron,
-                "vitaminD": vitamin_d,
-            }
-            for key, value in optional_fields.items():
-                if value is not None:
-                    nutrition[key] = _num_to_str(value)
 
-            food_meta: dict = {
-                "foodName": food_name,
-                "foodType": "GENERIC",
-                "source": "GARMIN",
-                "regionCode": "US",
-                "languageCode": "en",
-            }
+            food_meta: dict = {**_FOOD_META_BASE, "foodName": food_name}
             if brand_name is not None:
                 food_meta["brandName"] = brand_name
 
@@ -225,18 +353,16 @@ def register_tools(app):
                 "foodMetaData": food_meta,
                 "nutritionContents": [nutrition],
             }
-            url = "/nutrition-service/customFood"
-            resp = garmin_client.client.put(
-                "connectapi", url, json=payload, api=True
+            url = _CUSTOM_FOOD_PATH
+            resp = await asyncio.to_thread(
+                garmin_client.client.put, "connectapi", url, json=payload, api=True
             )
+            invalidate_response_cache()
             if not resp:
                 return "Custom food created (no response data returned)."
-            return json.dumps(resp, indent=2)
+            return to_json(resp)
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error creating custom food: {e} | Response: {body}"
+            return f"Error creating custom food: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error creating custom food: {str(e)}"
 
@@ -303,12 +429,8 @@ def register_tools(app):
             existing_nutrition: dict = {}
             existing_brand: Optional[str] = None
             try:
-                search_url = (
-                    f"/nutrition-service/customFood"
-                    f"?searchExpression={quote(food_name)}"
-                    f"&start=0&limit=20&includeContent=true"
-                )
-                search_data = garmin_client.connectapi(search_url)
+                search_url = _custom_food_search_url(food_name, 0, 20)
+                search_data = await asyncio.to_thread(garmin_client.connectapi, search_url)
                 foods = search_data.get("customFoods", []) if isinstance(search_data, dict) else []
                 for f in foods:
                     if str(f.get("foodMetaData", {}).get("foodId", "")) == food_id:
@@ -318,22 +440,6 @@ def register_tools(app):
             except Exception:
                 pass  # proceed without existing data; caller's values win
 
-            # API field name → optional param value (None means "not supplied by caller")
-            optional_updates = {
-                "carbs": carbs,
-                "protein": protein,
-                "fat": fat,
-                "fiber": fiber,
-                "sugar": sugar,
-                "saturatedFat": saturated_fat,
-                "sodium": sodium,
-                "cholesterol": cholesterol,
-                "potassium": potassium,
-                "transFat": trans_fat,
-                "calcium": calcium,
-                "iron": iron,
-                "vitaminD": vitamin_d,
-            }
             nutrition: dict = {
                 "servingId": serving_id,
                 "servingUnit": serving_unit,
@@ -341,24 +447,32 @@ def register_tools(app):
                 "calories": _num_to_str(calories),
             }
             # Carry forward existing optional fields, then overlay caller-supplied values.
-            preserved_keys = set(optional_updates.keys())
             for key, existing_val in existing_nutrition.items():
-                if key in preserved_keys and existing_val is not None:
+                if key in _OPTIONAL_NUTRIENT_KEYS and existing_val is not None:
                     nutrition[key] = _num_to_str(existing_val)
-            for key, value in optional_updates.items():
-                if value is not None:
-                    nutrition[key] = _num_to_str(value)
+            nutrition.update(_optional_nutrients(
+                carbs=carbs,
+                protein=protein,
+                fat=fat,
+                fiber=fiber,
+                sugar=sugar,
+                saturated_fat=saturated_fat,
+                sodium=sodium,
+                cholesterol=cholesterol,
+                potassium=potassium,
+                trans_fat=trans_fat,
+                calcium=calcium,
+                iron=iron,
+                vitamin_d=vitamin_d,
+            ))
 
             # Effective brand: caller-supplied wins, else preserve existing, else omit.
             effective_brand = brand_name if brand_name is not None else existing_brand
 
             food_meta: dict = {
+                **_FOOD_META_BASE,
                 "foodId": food_id,
                 "foodName": food_name,
-                "foodType": "GENERIC",
-                "source": "GARMIN",
-                "regionCode": "US",
-                "languageCode": "en",
             }
             if effective_brand is not None:
                 food_meta["brandName"] = effective_brand
@@ -367,18 +481,16 @@ def register_tools(app):
                 "foodMetaData": food_meta,
                 "nutritionContents": [nutrition],
             }
-            url = "/nutrition-service/customFood"
-            resp = garmin_client.client.put(
-                "connectapi", url, json=payload, api=True
+            url = _CUSTOM_FOOD_PATH
+            resp = await asyncio.to_thread(
+                garmin_client.client.put, "connectapi", url, json=payload, api=True
             )
+            invalidate_response_cache()
             if not resp:
                 return "Custom food updated (no response data returned)."
-            return json.dumps(resp, indent=2)
+            return to_json(resp)
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error updating custom food: {e} | Response: {body}"
+            return f"Error updating custom food: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error updating custom food: {str(e)}"
 
@@ -395,18 +507,15 @@ def register_tools(app):
                 (from get_custom_foods or create_custom_food)
         """
         try:
-            url = f"/nutrition-service/customFood/{food_id}"
-            garmin_client.client.delete("connectapi", url, api=True)
-            return json.dumps(
+            url = _custom_food_url(food_id)
+            await asyncio.to_thread(garmin_client.client.delete, "connectapi", url, api=True)
+            invalidate_response_cache()
+            return to_json(
                 {"status": "success", "food_id": food_id,
-                 "message": f"Custom food {food_id} deleted successfully."},
-                indent=2,
+                 "message": f"Custom food {food_id} deleted successfully."}
             )
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error deleting custom food: {e} | Response: {body}"
+            return f"Error deleting custom food: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error deleting custom food: {str(e)}"
 
@@ -437,62 +546,109 @@ def register_tools(app):
             serving_qty: Number of servings (default 1)
         """
         try:
-            from datetime import datetime, timezone
-
-            meals_url = f"/nutrition-service/meals/{meal_date}"
-            meals_data = garmin_client.connectapi(meals_url)
+            _validate_date(meal_date, "meal_date")
+            meals_url = _meals_url(meal_date)
+            meals_data = await asyncio.to_thread(garmin_client.connectapi, meals_url)
             meals = (meals_data or {}).get("meals", [])
 
-            meal_id = None
-            for m in meals:
-                start = m.get("startTime")
-                end = m.get("endTime")
-                if start and end and start <= meal_time <= end:
-                    meal_id = m["mealId"]
-                    break
+            meal_id = _match_meal_id(meals, meal_time)
             if meal_id is None:
-                snacks = next((m for m in meals if m.get("mealName") == "SNACKS"), None)
-                if snacks is None:
-                    return f"Error logging food: could not match meal for time '{meal_time}' and no SNACKS meal found."
-                meal_id = snacks["mealId"]
+                return f"Error logging food: could not match meal for time '{meal_time}' and no SNACKS meal found."
 
-            log_timestamp = datetime.now(timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%S.000Z"
-            )
+            log_timestamp = _log_timestamp()
             payload = {
                 "mealDate": meal_date,
                 "foodLogItems": [
                     {
+                        **_FOOD_LOG_ITEM_BASE,
                         "logTimestamp": log_timestamp,
-                        "logSource": "GCW",
-                        "logCategory": "REGULAR_LOG",
                         "mealTime": meal_time,
-                        "action": "ADD",
                         "mealId": meal_id,
                         "foodId": food_id,
                         "servingId": serving_id,
-                        "source": "GARMIN",
-                        "regionCode": "US",
-                        "languageCode": "en",
                         "servingQty": serving_qty,
                     }
                 ],
             }
-            url = "/nutrition-service/food/logs"
-            resp = garmin_client.client.put(
-                "connectapi", url, json=payload, api=True
+            url = _FOOD_LOGS_PATH
+            resp = await asyncio.to_thread(
+                garmin_client.client.put, "connectapi", url, json=payload, api=True
             )
+            invalidate_response_cache()
             if not resp:
                 return "Food logged successfully."
-            return json.dumps(resp, indent=2)
+            return to_json(resp)
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error logging food: {e} | Response: {body}"
+            return f"Error logging food: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error logging food: {str(e)}"
 
+    @app.tool()
+    async def log_custom_foods(
+        meal_date: str,
+        meal_time: str,
+        foods: list[dict],
+    ) -> str:
+        """Log several custom food items to one meal in a single call
+
+        Same as log_custom_food, but sends every item in one request, which is
+        much faster than logging a whole meal item by item. The meal is
+        determined from meal_time as in log_custom_food.
+
+        Args:
+            meal_date: Date in YYYY-MM-DD format
+            meal_time: Time in HH:MM:SS format (e.g. "12:30:00", account timezone)
+            foods: List of items, each with "food_id" and "serving_id" (from
+                get_custom_foods or create_custom_food) and an optional
+                "serving_qty" (default 1)
+        """
+        try:
+            _validate_date(meal_date, "meal_date")
+            if not foods:
+                return "Error logging foods: no food items given."
+            missing = [
+                i for i, food in enumerate(foods)
+                if not food.get("food_id") or not food.get("serving_id")
+            ]
+            if missing:
+                return f"Error logging foods: items {missing} are missing food_id or serving_id."
+
+            meals_url = _meals_url(meal_date)
+            meals_data = await asyncio.to_thread(garmin_client.connectapi, meals_url)
+            meals = (meals_data or {}).get("meals", [])
+            meal_id = _match_meal_id(meals, meal_time)
+            if meal_id is None:
+                return f"Error logging foods: could not match meal for time '{meal_time}' and no SNACKS meal found."
+
+            log_timestamp = _log_timestamp()
+            payload = {
+                "mealDate": meal_date,
+                "foodLogItems": [
+                    {
+                        **_FOOD_LOG_ITEM_BASE,
+                        "logTimestamp": log_timestamp,
+                        "mealTime": meal_time,
+                        "mealId": meal_id,
+                        "foodId": food["food_id"],
+                        "servingId": food["serving_id"],
+                        "servingQty": food.get("serving_qty", 1),
+                    }
+                    for food in foods
+                ],
+            }
+            url = _FOOD_LOGS_PATH
+            resp = await asyncio.to_thread(
+                garmin_client.client.put, "connectapi", url, json=payload, api=True
+            )
+            invalidate_response_cache()
+            if not resp:
+                return f"Logged {len(foods)} food items successfully."
+            return to_json(resp)
+        except GarminConnectConnectionError as e:
+            return f"Error logging foods: {e} | Response: {_error_body(e)}"
+        except Exception as e:
+            return f"Error logging foods: {str(e)}"
+
     @app.tool()
     async def log_food(
         meal_date: str,
@@ -520,28 +676,16 @@ def register_tools(app):
             meal_time: Time in HH:MM:SS format (account timezone)
         """
         try:
-            from datetime import datetime, timezone
-
-            meals_url = f"/nutrition-service/meals/{meal_date}"
-            meals_data = garmin_client.connectapi(meals_url)
+            _validate_date(meal_date, "meal_date")
+            meals_url = _meals_url(meal_date)
+            meals_data = await asyncio.to_thread(garmin_client.connectapi, meals_url)
             meals = (meals_data or {}).get("meals", [])
 
-            # Match meal_time against startTime/endTime windows; fall back to SNACKS
-            meal_id = None
-            for m in meals:
-                start = m.get("startTime")
-                end = m.get("endTime")
-                if start and end and start <= meal_time <= end:
-                    meal_id = m["mealId"]
-                    break
+            meal_id = _match_meal_id(meals, meal_time)
             if meal_id is None:
-                snacks = next((m for m in meals if m.get("mealName") == "SNACKS"), None)
-                if snacks is None:
-                    return f"Error logging food: could not match meal for time '{meal_time}' and no SNACKS meal found."
-                meal_id = snacks["mealId"]
+                return f"Error logging food: could not match meal for time '{meal_time}' and no SNACKS meal found."
 
-            now = datetime.now(timezone.utc)
-            log_timestamp = now.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            log_timestamp = _log_timestamp()
             payload = {
                 "mealDate": meal_date,
                 "quickAddItems": [
@@ -562,17 +706,15 @@ def register_tools(app):
                 ],
             }
             url = "/nutrition-service/food/logs/quickAdd"
-            resp = garmin_client.client.put(
-                "connectapi", url, json=payload, api=True
+            resp = await asyncio.to_thread(
+                garmin_client.client.put, "connectapi", url, json=payload, api=True
             )
+            invalidate_response_cache()
             if not resp:
                 return "Food logged successfully."
-            return json.dumps(resp, indent=2)
+            return to_json(resp)
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error logging food: {e} | Response: {body}"
+            return f"Error logging food: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error logging food: {str(e)}"
 
@@ -590,14 +732,15 @@ def register_tools(app):
             meal_date: Date of the log entry in YYYY-MM-DD format
         """
         try:
-            url = f"/nutrition-service/food/logs/{meal_date}"
-            garmin_client.client.delete("connectapi", url, json={"logIds": [log_id]}, api=True)
-            return json.dumps({"status": "success", "log_id": log_id, "message": f"Food log entry {log_id} deleted successfully."}, indent=2)
+            _validate_date(meal_date, "meal_date")
+            url = _food_log_url(meal_date)
+            await asyncio.to_thread(
+                garmin_client.client.delete, "connectapi", url, json={"logIds": [log_id]}, api=True
+            )
+            invalidate_response_cache()
+            return to_json({"status": "success", "log_id": log_id, "message": f"Food log entry {log_id} deleted successfully."})
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error deleting food log: {e} | Response: {body}"
+            return f"Error deleting food log: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error deleting food log: {str(e)}"
 
@@ -635,15 +778,10 @@ def register_tools(app):
             serving_qty: Number of servings to log (default 1)
         """
         try:
-            from datetime import datetime, timezone
-
+            _validate_date(meal_date, "meal_date")
             # 1. Search for existing custom food
-            search_url = (
-                f"/nutrition-service/customFood"
-                f"?searchExpression={quote(food_name)}"
-                f"&start=0&limit=10&includeContent=true"
-            )
-            search_data = garmin_client.connectapi(search_url)
+            search_url = _custom_food_search_url(food_name, 0, 10)
+            search_data = await asyncio.to_thread(garmin_client.connectapi, search_url)
             foods = search_data.get("customFoods", []) if isinstance(search_data, dict) else []
 
             food_id = None
@@ -665,23 +803,15 @@ def register_tools(app):
                     "numberOfUnits": _num_to_str(number_of_units),
                     "calories": _num_to_str(calories),
                 }
-                optional_fields = {"carbs": carbs, "protein": protein, "fat": fat}
-                for key, value in optional_fields.items():
-                    if value is not None:
-                        nutrition[key] = _num_to_str(value)
+                nutrition.update(_optional_nutrients(carbs=carbs, protein=protein, fat=fat))
                 create_payload = {
-                    "foodMetaData": {
-                        "foodName": food_name,
-                        "foodType": "GENERIC",
-                        "source": "GARMIN",
-                        "regionCode": "US",
-                        "languageCode": "en",
-                    },
+                    "foodMetaData": {**_FOOD_META_BASE, "foodName": food_name},
                     "nutritionContents": [nutrition],
                 }
-                create_resp = garmin_client.client.put(
-                    "connectapi", "/nutrition-service/customFood", json=create_payload, api=True
+                create_resp = await asyncio.to_thread(
+                    garmin_client.client.put, "connectapi", _CUSTOM_FOOD_PATH, json=create_payload, api=True
                 )
+                invalidate_response_cache()
                 # api=True means create_resp is already a parsed dict; errors raise GarminConnectConnectionError.
                 if create_resp:  # non-empty: response body contains foodId/servingId
                     meta = create_resp.get("foodMetaData", create_resp)
@@ -691,12 +821,8 @@ def register_tools(app):
                         serving_id = str(contents[0].get("servingId", ""))
                 # 204: no body — look up by name
                 if not food_id or not serving_id:
-                    lookup_url = (
-                        f"/nutrition-service/customFood"
-                        f"?searchExpression={quote(food_name)}"
-                        f"&start=0&limit=10&includeContent=true"
-                    )
-                    lookup_data = garmin_client.connectapi(lookup_url)
+                    lookup_url = _custom_food_search_url(food_name, 0, 10)
+                    lookup_data = await asyncio.to_thread(garmin_client.connectapi, lookup_url)
                     lookup_foods = lookup_data.get("customFoods", []) if isinstance(lookup_data, dict) else []
                     for f in lookup_foods:
                         meta = f.get("foodMetaData", f)
@@ -710,53 +836,37 @@ def register_tools(app):
                     return f"Error: could not retrieve foodId/servingId for '{food_name}' after creation."
 
             # 3. Resolve meal_id from meal_time
-            meals_data = garmin_client.connectapi(f"/nutrition-service/meals/{meal_date}")
+            meals_data = await asyncio.to_thread(garmin_client.connectapi, _meals_url(meal_date))
             meals = (meals_data or {}).get("meals", [])
-            meal_id = None
-            for m in meals:
-                start = m.get("startTime")
-                end = m.get("endTime")
-                if start and end and start <= meal_time <= end:
-                    meal_id = m["mealId"]
-                    break
+            meal_id = _match_meal_id(meals, meal_time)
             if meal_id is None:
-                snacks = next((m for m in meals if m.get("mealName") == "SNACKS"), None)
-                if snacks is None:
-                    return f"Error logging food: could not match meal for time '{meal_time}' and no SNACKS meal found."
-                meal_id = snacks["mealId"]
+                return f"Error logging food: could not match meal for time '{meal_time}' and no SNACKS meal found."
 
             # 4. Log
-            log_timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            log_timestamp = _log_timestamp()
             log_payload = {
                 "mealDate": meal_date,
                 "foodLogItems": [
                     {
+                        **_FOOD_LOG_ITEM_BASE,
                         "logTimestamp": log_timestamp,
-                        "logSource": "GCW",
-                        "logCategory": "REGULAR_LOG",
                         "mealTime": meal_time,
-                        "action": "ADD",
                         "mealId": meal_id,
                         "foodId": food_id,
                         "servingId": serving_id,
-                        "source": "GARMIN",
-                        "regionCode": "US",
-                        "languageCode": "en",
                         "servingQty": serving_qty,
                     }
                 ],
             }
-            log_resp = garmin_client.client.put(
-                "connectapi", "/nutrition-service/food/logs", json=log_payload, api=True
+            log_resp = await asyncio.to_thread(
+                garmin_client.client.put, "connectapi", _FOOD_LOGS_PATH, json=log_payload, api=True
             )
+            invalidate_response_cache()
             if not log_resp:
                 return "Food logged successfully."
-            return json.dumps(log_resp, indent=2)
+            return to_json(log_resp)
         except GarminConnectConnectionError as e:
-            body = ""
-            if hasattr(e, "error") and hasattr(e.error, "response"):
-                body = getattr(e.error.response, "text", "")
-            return f"Error in upsert_and_log: {e} | Response: {body}"
+            return f"Error in upsert_and_log: {e} | Response: {_error_body(e)}"
         except Exception as e:
             return f"Error in upsert_and_log: {str(e)}"
 
@@ -0,0 +1,59 @@
+"""
+Short-lived in-memory cache for tool read responses.
+
+Agents often repeat the same read several times within one conversation.
+Tool modules keep one TTLCache each and clear it on every write they (or
+a sibling module) make, so reads never lag our own writes.
+"""
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Map of keys to values that expire after a fixed number of seconds.
+
+    When the cache is full it is emptied rather than evicting single
+    entries; it only holds a handful of recent reads.
+
+    ``generation`` counts clear() calls. A read that awaits its fetch
+    captures it first and passes it to put(), so data fetched before a
+    write is not cached after that write has cleared the cache.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: dict = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value cached for key, or None if absent or expired."""
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> Any:
+        """Cache value for key (for ttl seconds, default self.ttl) and return it.
+
+        If generation is given and the cache has been cleared since it was
+        read, value is returned without being cached.
+        """
+        if generation is not None and generation != self.generation:
+            return value
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires, value)
+        return value
+
+    def clear(self) -> None:
+        """Forget every cached value and start a new generation."""
+        self._entries.clear()
+        self.generation += 1
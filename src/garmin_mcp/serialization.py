@@ -0,0 +1,36 @@
+"""
+JSON serialization for tool responses.
+
+Uses orjson (a native encoder, several times faster than the stdlib on large
+responses) and falls back to the stdlib json module for values orjson cannot
+encode, or if orjson is unavailable. Both paths produce the same 2-space
+indented, non-ASCII-preserving output, and both raise TypeError for values
+that are not plain JSON data.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # declared dependency; guard keeps a broken install usable
+    orjson = None
+
+if orjson is not None:
+    # Date/dataclass values are passed through so they raise like the stdlib
+    # encoder instead of being silently converted.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def to_json(data: Any) -> str:
+    """Serialize a tool response as 2-space indented JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
@@ -1,10 +1,11 @@
 """
 User Profile functions for Garmin Connect MCP Server
 """
-import json
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from garmin_mcp.serialization import to_json
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -23,7 +24,7 @@ def register_tools(app):
         """Get user's full name from profile"""
         try:
             full_name = garmin_client.get_full_name()
-            return json.dumps({"full_name": full_name}, indent=2)
+            return to_json({"full_name": full_name})
         except Exception as e:
             return f"Error retrieving user's full name: {str(e)}"
 
@@ -32,7 +33,7 @@ def register_tools(app):
         """Get user's preferred unit system from profile"""
         try:
             unit_system = garmin_client.get_unit_system()
-            return json.dumps({"unit_system": unit_system}, indent=2)
+            return to_json({"unit_system": unit_system})
         except Exception as e:
             return f"Error retrieving unit system: {str(e)}"
     
@@ -43,7 +44,7 @@ def register_tools(app):
             profile = garmin_client.get_user_profile()
             if not profile:
                 return "No user profile information found."
-            return json.dumps(profile, indent=2)
+            return to_json(profile)
         except Exception as e:
             return f"Error retrieving user profile: {str(e)}"
 
@@ -54,7 +55,7 @@ def register_tools(app):
             settings = garmin_client.get_userprofile_settings()
             if not settings:
                 return "No user profile settings found."
-            return json.dumps(settings, indent=2)
+            return to_json(settings)
         except Exception as e:
             return f"Error retrieving user profile settings: {str(e)}"
 
@@ -7,6 +7,9 @@ to the existing upload_workout / schedule_workout endpoints.
 import json
 from typing import Any, Dict, List, Optional
 
+# Both modules share the same garmin_client instance via configure() in main().
+from garmin_mcp.workouts import _is_already_scheduled, invalidate_response_cache
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -325,6 +328,7 @@ def register_tools(app):
                 hr_zone=hr_zone,
             )
             result = garmin_client.upload_workout(workout_json)
+            invalidate_response_cache()
 
             if isinstance(result, dict):
                 curated = {
@@ -367,6 +371,7 @@ def register_tools(app):
                 hr_zone=hr_zone,
             )
             result = garmin_client.upload_workout(workout_json)
+            invalidate_response_cache()
 
             if isinstance(result, dict):
                 curated = {
@@ -404,6 +409,7 @@ def register_tools(app):
                 hr_max=hr_max,
             )
             result = garmin_client.upload_workout(workout_json)
+            invalidate_response_cache()
 
             if isinstance(result, dict):
                 curated = {
@@ -435,6 +441,7 @@ def register_tools(app):
         try:
             workout_json = build_strength_json(name=name, exercises=exercises)
             result = garmin_client.upload_workout(workout_json)
+            invalidate_response_cache()
 
             if isinstance(result, dict):
                 curated = {
@@ -460,11 +467,6 @@ def register_tools(app):
         Args:
             week: List of dicts with keys: date (YYYY-MM-DD), workout_id (int)
         """
-        # Imported here (not at module top) to avoid any import-time ordering
-        # surprises between sibling modules. Both modules share the same
-        # garmin_client instance via configure() in __main__.
-        from garmin_mcp.workouts import _is_already_scheduled
-
         try:
             results = []
             for item in week:
@@ -485,6 +487,7 @@ def register_tools(app):
                 response = garmin_client.client.post(
                     "connectapi", url, json={"date": calendar_date}
                 )
+                invalidate_response_cache()
                 if response.status_code == 200:
                     results.append({
                         "date": calendar_date,
@@ -1,21 +1,28 @@
 """
 Workout-related functions for Garmin Connect MCP Server
 """
-import json
 import re
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from garmin_mcp.response_cache import TTLCache
+from garmin_mcp.serialization import to_json
+
 _DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 
 
-def _validate_date(value: str, field: str = "date") -> str:
+def _validate_date(value: str, field: str = "date") -> None:
     if not _DATE_RE.match(value):
         raise ValueError(f"Invalid {field} '{value}': expected YYYY-MM-DD")
 
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
+# Serialized responses of the list tools, keyed by (tool, *args). Agents tend
+# to re-list workouts and the calendar several times while planning.
+_response_cache = TTLCache(ttl=30, max_entries=128)
+
 END_CONDITION_TYPE_IDS = {
     "lap.button": 1,
     "time": 2,
@@ -54,10 +61,35 @@ KNOWN_TARGET_TYPE_KEYS = {
     for key in keys
 }
 
+# GraphQL query templates; arguments are validated YYYY-MM-DD dates.
+_SCHEDULE_SUMMARIES_QUERY = (
+    'query{{workoutScheduleSummariesScalar(startDate:"{start}", endDate:"{end}")}}'
+).format
+_TRAINING_PLAN_QUERY = (
+    'query{{trainingPlanScalar(calendarDate:"{date}", lang:"en-US", firstDayOfWeek:"monday")}}'
+).format
+
 def configure(client):
     """Configure the module with the Garmin client instance"""
     global garmin_client
     garmin_client = client
+    _response_cache.clear()
+
+
+def invalidate_response_cache() -> None:
+    """Forget cached workout list responses.
+
+    Called after every workout or schedule write, including the ones made by
+    other modules (workout_builders).
+    """
+    _response_cache.clear()
+
+
+def _drop_none(data: dict) -> dict:
+    """Delete None-valued keys from data in place and return it."""
+    for key in [k for k, v in data.items() if v is None]:
+        del data[key]
+    return data
 
 
 def _fix_hr_zone_step(step: dict) -> None:
@@ -236,17 +268,17 @@ def _curate_workout_summary(workout: dict) -> dict:
     }
 
     # Add optional fields if present
-    if workout.get('description'):
-        summary['description'] = workout.get('description')
+    if (description := workout.get('description')):
+        summary['description'] = description
 
-    if workout.get('estimatedDuration'):
-        summary['estimated_duration_seconds'] = workout.get('estimatedDuration')
+    if (estimated_duration := workout.get('estimatedDuration')):
+        summary['estimated_duration_seconds'] = estimated_duration
 
-    if workout.get('estimatedDistance'):
-        summary['estimated_distance_meters'] = workout.get('estimatedDistance')
+    if (estimated_distance := workout.get('estimatedDistance')):
+        summary['estimated_distance_meters'] = estimated_distance
 
     # Remove None values
-    return {k: v for k, v in summary.items() if v is not None}
+    return _drop_none(summary)
 
 
 def _curate_step_target(
@@ -269,12 +301,12 @@ def _curate_step_target(
 
     curated[f'{prefix}target_type'] = target_key
 
-    if step.get(value_one_field) is not None:
-        curated[f'{prefix}target_value_low'] = step.get(value_one_field)
-    if step.get(value_two_field) is not None:
-        curated[f'{prefix}target_value_high'] = step.get(value_two_field)
-    if step.get(zone_field) is not None:
-        curated[f'{prefix}target_zone'] = step.get(zone_field)
+    if (value_low := step.get(value_one_field)) is not None:
+        curated[f'{prefix}target_value_low'] = value_low
+    if (value_high := step.get(value_two_field)) is not None:
+        curated[f'{prefix}target_value_high'] = value_high
+    if (zone := step.get(zone_field)) is not None:
+        curated[f'{prefix}target_zone'] = zone
 
 
 def _curate_workout_step(step: dict) -> dict:
@@ -288,15 +320,15 @@ def _curate_workout_step(step: dict) -> dict:
     }
 
     # Description
-    if step.get('description'):
-        curated['description'] = step.get('description')
+    if (description := step.get('description')):
+        curated['description'] = description
 
     # End condition (duration/distance/lap press)
-    if end_condition.get('conditionTypeKey'):
-        curated['end_condition'] = end_condition.get('conditionTypeKey')
-    if step.get('endConditionValue'):
+    if (condition_type_key := end_condition.get('conditionTypeKey')):
+        curated['end_condition'] = condition_type_key
+    if (end_condition_value := step.get('endConditionValue')):
         # Value meaning depends on condition type (seconds for time, meters for distance)
-        curated['end_condition_value'] = step.get('endConditionValue')
+        curated['end_condition_value'] = end_condition_value
 
     # Primary target (heart rate, pace, power, etc.)
     _curate_step_target(
@@ -320,15 +352,15 @@ def _curate_workout_step(step: dict) -> dict:
     )
 
     # Strength training exercise info
-    if step.get('category'):
-        curated['category'] = step.get('category')
-    if step.get('exerciseName'):
-        curated['exercise_name'] = step.get('exerciseName')
-    if step.get('weightValue') is not None:
-        curated['weight_value'] = step.get('weightValue')
+    if (category := step.get('category')):
+        curated['category'] = category
+    if (exercise_name := step.get('exerciseName')):
+        curated['exercise_name'] = exercise_name
+    if (weight_value := step.get('weightValue')) is not None:
+        curated['weight_value'] = weight_value
         weight_unit = step.get('weightUnit', {})
-        if weight_unit and weight_unit.get('unitKey'):
-            curated['weight_unit'] = weight_unit.get('unitKey')
+        if weight_unit and (unit_key := weight_unit.get('unitKey')):
+            curated['weight_unit'] = unit_key
 
     # Repeat info for repeat steps
     if step.get('type') == 'RepeatGroupDTO':
@@ -338,7 +370,7 @@ def _curate_workout_step(step: dict) -> dict:
             curated['steps'] = [_curate_workout_step(s) for s in nested_steps]
             curated['step_count'] = len(nested_steps)
 
-    return {k: v for k, v in curated.items() if v is not None}
+    return _drop_none(curated)
 
 
 def _curate_workout_segment(segment: dict) -> dict:
@@ -351,10 +383,10 @@ def _curate_workout_segment(segment: dict) -> dict:
     }
 
     # Estimated metrics
-    if segment.get('estimatedDurationInSecs'):
-        curated['estimated_duration_seconds'] = segment.get('estimatedDurationInSecs')
-    if segment.get('estimatedDistanceInMeters'):
-        curated['estimated_distance_meters'] = segment.get('estimatedDistanceInMeters')
+    if (estimated_duration_in_secs := segment.get('estimatedDurationInSecs')):
+        curated['estimated_duration_seconds'] = estimated_duration_in_secs
+    if (estimated_distance_in_meters := segment.get('estimatedDistanceInMeters')):
+        curated['estimated_distance_meters'] = estimated_distance_in_meters
 
     # Workout steps - the actual content of the segment
     steps = segment.get('workoutSteps', [])
@@ -362,7 +394,7 @@ def _curate_workout_segment(segment: dict) -> dict:
         curated['steps'] = [_curate_workout_step(s) for s in steps]
         curated['step_count'] = len(steps)
 
-    return {k: v for k, v in curated.items() if v is not None}
+    return _drop_none(curated)
 
 
 def _curate_workout_details(workout: dict) -> dict:
@@ -384,8 +416,8 @@ def _curate_workout_details(workout: dict) -> dict:
     }
 
     # Optional fields
-    if workout.get('description'):
-        details['description'] = workout.get('description')
+    if (description := workout.get('description')):
+        details['description'] = description
 
     # Handle both field name variants (regular vs training plan workouts)
     duration = workout.get('estimatedDuration') or workout.get('estimatedDurationInSecs')
@@ -396,18 +428,18 @@ def _curate_workout_details(workout: dict) -> dict:
     if distance:
         details['estimated_distance_meters'] = distance
 
-    if workout.get('avgTrainingSpeed'):
-        details['avg_training_speed_mps'] = workout.get('avgTrainingSpeed')
+    if (avg_training_speed := workout.get('avgTrainingSpeed')):
+        details['avg_training_speed_mps'] = avg_training_speed
 
     # Training plan specific fields
-    if workout.get('workoutPhrase'):
-        details['workout_type'] = workout.get('workoutPhrase')
+    if (workout_phrase := workout.get('workoutPhrase')):
+        details['workout_type'] = workout_phrase
 
-    if workout.get('trainingEffectLabel'):
-        details['training_effect_label'] = workout.get('trainingEffectLabel')
+    if (training_effect_label := workout.get('trainingEffectLabel')):
+        details['training_effect_label'] = training_effect_label
 
-    if workout.get('estimatedTrainingEffect'):
-        details['estimated_training_effect'] = workout.get('estimatedTrainingEffect')
+    if (estimated_training_effect := workout.get('estimatedTrainingEffect')):
+        details['estimated_training_effect'] = estimated_training_effect
 
     # Curate segments with workout steps
     segments = workout.get('workoutSegments', [])
@@ -416,14 +448,15 @@ def _curate_workout_details(workout: dict) -> dict:
         details['segment_count'] = len(segments)
 
     # Remove None values
-    return {k: v for k, v in details.items() if v is not None}
+    return _drop_none(details)
 
 
 def _curate_scheduled_workout(scheduled: dict) -> dict:
     """Extract essential scheduled workout information from GraphQL response"""
     # GraphQL response has workout data at top level (not nested)
     # Completed is determined by presence of associatedActivityId
-    is_completed = scheduled.get('associatedActivityId') is not None
+    activity_id = scheduled.get('associatedActivityId')
+    is_completed = activity_id is not None
 
     summary = {
         "date": scheduled.get('scheduleDate'),
@@ -438,13 +471,13 @@ def _curate_scheduled_workout(scheduled: dict) -> dict:
     }
 
     # Training plan info
-    if scheduled.get('tpPlanName'):
-        summary['training_plan'] = scheduled.get('tpPlanName')
+    if (tp_plan_name := scheduled.get('tpPlanName')):
+        summary['training_plan'] = tp_plan_name
 
     # Workout type description (e.g., "AEROBIC_LOW_SHORTAGE_BASE", "ANAEROBIC_SPEED", "LONG_WORKOUT")
     # This describes the intent/type of the workout from Garmin Coach
-    if scheduled.get('workoutPhrase'):
-        summary['workout_type'] = scheduled.get('workoutPhrase')
+    if (workout_phrase := scheduled.get('workoutPhrase')):
+        summary['workout_type'] = workout_phrase
 
     # Rest day and race day flags
     if scheduled.get('isRestDay'):
@@ -453,18 +486,18 @@ def _curate_scheduled_workout(scheduled: dict) -> dict:
         summary['is_race_day'] = True
 
     # Optional fields
-    if scheduled.get('estimatedDurationInSecs'):
-        summary['estimated_duration_seconds'] = scheduled.get('estimatedDurationInSecs')
+    if (estimated_duration_in_secs := scheduled.get('estimatedDurationInSecs')):
+        summary['estimated_duration_seconds'] = estimated_duration_in_secs
 
-    if scheduled.get('estimatedDistanceInMeters'):
-        summary['estimated_distance_meters'] = scheduled.get('estimatedDistanceInMeters')
+    if (estimated_distance_in_meters := scheduled.get('estimatedDistanceInMeters')):
+        summary['estimated_distance_meters'] = estimated_distance_in_meters
 
     # If completed, include the activity ID
     if is_completed:
-        summary['activity_id'] = scheduled.get('associatedActivityId')
+        summary['activity_id'] = activity_id
 
     # Remove None values
-    return {k: v for k, v in summary.items() if v is not None}
+    return _drop_none(summary)
 
 
 def _is_already_scheduled(workout_id: int, calendar_date: str) -> bool:
@@ -476,12 +509,7 @@ def _is_already_scheduled(workout_id: int, calendar_date: str) -> bool:
     """
     try:
         _validate_date(calendar_date, "calendar_date")
-        query = {
-            "query": (
-                f'query{{workoutScheduleSummariesScalar('
-                f'startDate:"{calendar_date}", endDate:"{calendar_date}")}}'
-            )
-        }
+        query = {"query": _SCHEDULE_SUMMARIES_QUERY(start=calendar_date, end=calendar_date)}
         result = garmin_client.query_garmin_graphql(query) or {}
         existing = (
             result.get("data", {}).get("workoutScheduleSummariesScalar", []) or []
@@ -509,6 +537,10 @@ def register_tools(app):
         Returns a count and list of workout summaries with essential metadata only.
         For detailed workout information including segments, use get_workout_by_id.
         """
+        key = ("get_workouts",)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             workouts = garmin_client.get_workouts()
             if not workouts:
@@ -520,7 +552,7 @@ def register_tools(app):
                 "workouts": [_curate_workout_summary(w) for w in workouts]
             }
 
-            return json.dumps(curated, indent=2)
+            return _response_cache.put(key, to_json(curated))
         except Exception as e:
             return f"Error retrieving workouts: {str(e)}"
 
@@ -555,7 +587,7 @@ def register_tools(app):
 
             # Return curated details with segments
             curated = _curate_workout_details(workout)
-            return json.dumps(curated, indent=2)
+            return to_json(curated)
         except Exception as e:
             return f"Error retrieving workout: {str(e)}"
 
@@ -576,12 +608,12 @@ def register_tools(app):
 
             # Return information about the download
             data_size = len(workout_data) if isinstance(workout_data, (bytes, bytearray)) else 0
-            return json.dumps({
+            return to_json({
                 "workout_id": workout_id,
                 "format": "FIT",
                 "size_bytes": data_size,
                 "message": "Workout data is available in FIT format. Use Garmin Connect API to save to file."
-            }, indent=2)
+            })
         except Exception as e:
             return f"Error downloading workout: {str(e)}"
 
@@ -704,6 +736,7 @@ def register_tools(app):
 
             # Pass dict directly - library handles conversion
             result = garmin_client.upload_workout(workout_data)
+            invalidate_response_cache()
 
             # Curate the response
             if isinstance(result, dict):
@@ -714,10 +747,10 @@ def register_tools(app):
                     "message": "Workout uploaded successfully"
                 }
                 # Remove None values
-                curated = {k: v for k, v in curated.items() if v is not None}
-                return json.dumps(curated, indent=2)
+                curated = _drop_none(curated)
+                return to_json(curated)
 
-            return json.dumps(result, indent=2)
+            return to_json(result)
         except Exception as e:
             return f"Error uploading workout: {str(e)}"
 
@@ -757,6 +790,7 @@ def register_tools(app):
                 _validate_end_condition_steps(workout_data)
                 _validate_target_type_steps(workout_data)
                 result = garmin_client.upload_workout(workout_data)
+                invalidate_response_cache()
                 if isinstance(result, dict):
                     entry = {
                         "status": "success",
@@ -764,7 +798,7 @@ def register_tools(app):
                         "name": result.get('workoutName'),
                         "message": "Workout uploaded successfully"
                     }
-                    results.append({k: v for k, v in entry.items() if v is not None})
+                    results.append(_drop_none(entry))
                 else:
                     results.append({"status": "success", "message": "Workout uploaded successfully"})
             except Exception as e:
@@ -776,12 +810,12 @@ def register_tools(app):
 
         total = len(results)
         succeeded = sum(1 for r in results if r["status"] == "success")
-        return json.dumps({
+        return to_json({
             "total": total,
             "succeeded": succeeded,
             "failed": total - succeeded,
             "results": results
-        }, indent=2)
+        })
 
     @app.tool()
     async def delete_workout(workout_id: int) -> str:
@@ -798,17 +832,18 @@ def register_tools(app):
             # Response, so checking response.status_code raises AttributeError.
             # Delegate to the library and rely on exceptions to signal failure.
             garmin_client.delete_workout(workout_id)
-            return json.dumps({
+            invalidate_response_cache()
+            return to_json({
                 "status": "success",
                 "workout_id": workout_id,
                 "message": f"Workout {workout_id} deleted successfully"
-            }, indent=2)
+            })
         except Exception as e:
-            return json.dumps({
+            return to_json({
                 "status": "failed",
                 "workout_id": workout_id,
                 "message": f"Failed to delete workout: {str(e)}"
-            }, indent=2)
+            })
 
     @app.tool()
     async def delete_workouts(workout_ids: list[int]) -> str:
@@ -825,6 +860,7 @@ def register_tools(app):
                 # See note in delete_workout: high-level call avoids the
                 # garminconnect 0.3.2 dict-vs-Response trap.
                 garmin_client.delete_workout(workout_id)
+                invalidate_response_cache()
                 results.append({
                     "status": "success",
                     "workout_id": workout_id,
@@ -839,12 +875,12 @@ def register_tools(app):
 
         total = len(results)
         succeeded = sum(1 for r in results if r["status"] == "success")
-        return json.dumps({
+        return to_json({
             "total": total,
             "succeeded": succeeded,
             "failed": total - succeeded,
             "results": results
-        }, indent=2)
+        })
 
     @app.tool()
     async def get_scheduled_workouts(start_date: str, end_date: str) -> str:
@@ -857,13 +893,15 @@ def register_tools(app):
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
         """
+        key = ("get_scheduled_workouts", start_date, end_date)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             _validate_date(start_date, "start_date")
             _validate_date(end_date, "end_date")
             # Query for scheduled workouts using GraphQL
-            query = {
-                "query": f'query{{workoutScheduleSummariesScalar(startDate:"{start_date}", endDate:"{end_date}")}}'
-            }
+            query = {"query": _SCHEDULE_SUMMARIES_QUERY(start=start_date, end=end_date)}
             result = garmin_client.query_garmin_graphql(query)
 
             if not result or "data" not in result:
@@ -881,7 +919,7 @@ def register_tools(app):
                 "scheduled_workouts": [_curate_scheduled_workout(s) for s in scheduled]
             }
 
-            return json.dumps(curated, indent=2)
+            return _response_cache.put(key, to_json(curated))
         except Exception as e:
             return f"Error retrieving scheduled workouts: {str(e)}"
 
@@ -899,12 +937,14 @@ def register_tools(app):
         Args:
             calendar_date: Reference date in YYYY-MM-DD format (returns week's workouts)
         """
+        key = ("get_training_plan_workouts", calendar_date)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             _validate_date(calendar_date, "calendar_date")
             # Query for training plan workouts using GraphQL
-            query = {
-                "query": f'query{{trainingPlanScalar(calendarDate:"{calendar_date}", lang:"en-US", firstDayOfWeek:"monday")}}'
-            }
+            query = {"query": _TRAINING_PLAN_QUERY(date=calendar_date)}
             result = garmin_client.query_garmin_graphql(query)
 
             if not result or "data" not in result:
@@ -940,9 +980,9 @@ def register_tools(app):
             }
 
             # Remove None values from top level
-            curated = {k: v for k, v in curated.items() if v is not None}
+            curated = _drop_none(curated)
 
-            return json.dumps(curated, indent=2)
+            return _response_cache.put(key, to_json(curated))
         except Exception as e:
             return f"Error retrieving training plan workouts: {str(e)}"
 
@@ -962,7 +1002,7 @@ def register_tools(app):
         """
         try:
             if _is_already_scheduled(workout_id, calendar_date):
-                return json.dumps({
+                return to_json({
                     "status": "success",
                     "workout_id": workout_id,
                     "scheduled_date": calendar_date,
@@ -971,26 +1011,27 @@ def register_tools(app):
                         f"Workout {workout_id} already scheduled for "
                         f"{calendar_date} — no action taken"
                     )
-                }, indent=2)
+                })
 
             url = f"workout-service/schedule/{workout_id}"
             response = garmin_client.client.post("connectapi", url, json={"date": calendar_date})
+            invalidate_response_cache()
 
             if response.status_code == 200:
-                return json.dumps({
+                return to_json({
                     "status": "success",
                     "workout_id": workout_id,
                     "scheduled_date": calendar_date,
                     "message": f"Successfully scheduled workout {workout_id} for {calendar_date}"
-                }, indent=2)
+                })
             else:
-                return json.dumps({
+                return to_json({
                     "status": "failed",
                     "workout_id": workout_id,
                     "scheduled_date": calendar_date,
                     "http_status": response.status_code,
                     "message": f"Failed to schedule workout: HTTP {response.status_code}"
-                }, indent=2)
+                })
         except Exception as e:
             return f"Error scheduling workout: {str(e)}"
 
@@ -1051,6 +1092,7 @@ def register_tools(app):
                     _validate_end_condition_steps(workout_data)
                     _validate_target_type_steps(workout_data)
                     upload_result = garmin_client.upload_workout(workout_data)
+                    invalidate_response_cache()
                     if not isinstance(upload_result, dict) or upload_result.get('workoutId') is None:
                         results.append({
                             "status": "failed",
@@ -1079,6 +1121,7 @@ def register_tools(app):
 
                 url = f"workout-service/schedule/{workout_id}"
                 response = garmin_client.client.post("connectapi", url, json={"date": calendar_date})
+                invalidate_response_cache()
 
                 if response.status_code == 200:
                     entry = {
@@ -1108,12 +1151,12 @@ def register_tools(app):
 
         total = len(results)
         succeeded = sum(1 for r in results if r["status"] == "success")
-        return json.dumps({
+        return to_json({
             "total": total,
             "succeeded": succeeded,
             "failed": total - succeeded,
             "results": results
-        }, indent=2)
+        })
 
     @app.tool()
     async def unschedule_workout(scheduled_workout_id: int) -> str:
@@ -1139,17 +1182,18 @@ def register_tools(app):
             # signal failure rather than checking a status code — same pattern
             # as delete_workout.
             garmin_client.unschedule_workout(scheduled_workout_id)
-            return json.dumps({
+            invalidate_response_cache()
+            return to_json({
                 "status": "success",
                 "scheduled_workout_id": scheduled_workout_id,
                 "message": f"Scheduled workout {scheduled_workout_id} removed from calendar"
-            }, indent=2)
+            })
         except Exception as e:
-            return json.dumps({
+            return to_json({
                 "status": "failed",
                 "scheduled_workout_id": scheduled_workout_id,
                 "message": f"Failed to unschedule workout: {str(e)}"
-            }, indent=2)
+            })
 
     @app.tool()
     async def unschedule_workouts(scheduled_workout_ids: list[int]) -> str:
@@ -1170,6 +1214,7 @@ def register_tools(app):
                 # See note in unschedule_workout: high-level call returns a dict,
                 # so rely on exceptions to signal failure.
                 garmin_client.unschedule_workout(scheduled_workout_id)
+                invalidate_response_cache()
                 results.append({
                     "status": "success",
                     "scheduled_workout_id": scheduled_workout_id,
@@ -1184,11 +1229,11 @@ def register_tools(app):
 
         total = len(results)
         succeeded = sum(1 for r in results if r["status"] == "success")
-        return json.dumps({
+        return to_json({
             "total": total,
             "succeeded": succeeded,
             "failed": total - succeeded,
             "results": results
-        }, indent=2)
+        })
 
     return app
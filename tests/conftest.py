@@ -1,163 +1,140 @@
 """
 Shared pytest fixtures for Garmin MCP testing
 """
+import copy
 import pytest
 from unittest.mock import Mock
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from garminconnect import Garmin
 from mcp.server.fastmcp import FastMCP
 
+from tests.fixtures.garmin_responses import (
+    MOCK_ACTIVITIES,
+    MOCK_BODY_BATTERY,
+    MOCK_HEART_RATES,
+    MOCK_SLEEP_DATA,
+    MOCK_STEPS_DATA,
+    MOCK_TRAINING_STATUS,
+)
+
+# Client methods stubbed on the shared mock, with a factory for the value each
+# returns by default (called per test so tests never share a mutable default).
+_DEFAULT_RETURNS = (
+    ("get_activities", list),
+    ("get_stats", dict),
+    ("get_user_summary", dict),
+    ("get_body_composition", dict),
+    ("get_stats_and_body", dict),
+    ("get_steps_data", dict),
+    ("get_daily_steps", dict),
+    ("get_training_readiness", dict),
+    ("get_body_battery", dict),
+    ("get_body_battery_events", dict),
+    ("get_blood_pressure", dict),
+    ("get_floors", dict),
+    ("get_training_status", dict),
+    ("get_rhr_day", dict),
+    ("get_heart_rates", dict),
+    ("get_hydration_data", dict),
+    ("get_sleep_data", dict),
+    ("get_stress_data", dict),
+    ("get_respiration_data", dict),
+    ("get_spo2_data", dict),
+    ("get_all_day_stress", dict),
+    ("get_all_day_events", dict),
+)
+
+
+def _stub_default_returns(client):
+    """Point every stubbed method at a fresh copy of its default return value"""
+    client.configure_mock(
+        **{f"{name}.return_value": default() for name, default in _DEFAULT_RETURNS}
+    )
+
+
+@pytest.fixture(scope="session")
+def _mock_garmin_client_template():
+    """Build the mock Garmin client once per test session
+
+    Returns the client and the instance attributes it starts out with.
+    """
+    # Spec against a real (unauthenticated) instance rather than the class so
+    # attributes set in Garmin.__init__, like the garth `client`, exist too.
+    # spec_set also rejects assigning attributes the real client lacks.
+    client = Mock(spec_set=Garmin())
+    _stub_default_returns(client)
+    return client, frozenset(vars(client))
 
-@pytest.fixture
-def mock_garmin_client():
-    """Create a mock Garmin client with common methods stubbed"""
-    client = Mock()
-
-    # Configure mock to have all the methods we need
-    # By default, methods return None (can be overridden in tests)
-    client.get_activities = Mock(return_value=[])
-    client.get_stats = Mock(return_value={})
-    client.get_user_summary = Mock(return_value={})
-    client.get_body_composition = Mock(return_value={})
-    client.get_stats_and_body = Mock(return_value={})
-    client.get_steps_data = Mock(return_value={})
-    client.get_daily_steps = Mock(return_value={})
-    client.get_training_readiness = Mock(return_value={})
-    client.get_body_battery = Mock(return_value={})
-    client.get_body_battery_events = Mock(return_value={})
-    client.get_blood_pressure = Mock(return_value={})
-    client.get_floors = Mock(return_value={})
-    client.get_training_status = Mock(return_value={})
-    client.get_rhr_day = Mock(return_value={})
-    client.get_heart_rates = Mock(return_value={})
-    client.get_hydration_data = Mock(return_value={})
-    client.get_sleep_data = Mock(return_value={})
-    client.get_stress_data = Mock(return_value={})
-    client.get_respiration_data = Mock(return_value={})
-    client.get_spo2_data = Mock(return_value={})
-    client.get_all_day_stress = Mock(return_value={})
-    client.get_all_day_events = Mock(return_value={})
 
+@pytest.fixture
+def mock_garmin_client(_mock_garmin_client_template):
+    """Return the shared mock Garmin client, reset to its default stubs"""
+    client, template_attrs = _mock_garmin_client_template
+    # Drop call history, return values and side effects set by earlier tests,
+    # along with any attributes they assigned. An assigned mock is also kept
+    # as a child, so forget that too and let the next access build a fresh one.
+    client.reset_mock(return_value=True, side_effect=True)
+    for name in vars(client).keys() - template_attrs:
+        delattr(client, name)
+        client._mock_children.pop(name, None)
+    _stub_default_returns(client)
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def today_str():
     """Return today's date as YYYY-MM-DD string"""
-    return datetime.now().strftime("%Y-%m-%d")
+    return date.today().isoformat()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def yesterday_str():
     """Return yesterday's date as YYYY-MM-DD string"""
-    return (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    return (date.today() - timedelta(days=1)).isoformat()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def date_range():
     """Return a tuple of (start_date, end_date) as strings"""
-    end_date = datetime.now()
+    end_date = date.today()
     start_date = end_date - timedelta(days=7)
-    return (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+    return (start_date.isoformat(), end_date.isoformat())
 
 
 @pytest.fixture
 def sample_activity():
     """Sample activity data matching Garmin API response format"""
-    return {
-        "activityId": 12345678901,
-        "activityName": "Morning Run",
-        "activityType": {
-            "typeKey": "running",
-            "typeId": 1
-        },
-        "startTimeLocal": "2024-01-15 07:00:00",
-        "distance": 5000.0,
-        "duration": 1800.0,
-        "averageHR": 145,
-        "maxHR": 165,
-        "calories": 350
-    }
+    return copy.deepcopy(MOCK_ACTIVITIES[0])
 
 
 @pytest.fixture
 def sample_steps_data():
     """Sample steps data matching Garmin API response format"""
-    return {
-        "steps": 10000,
-        "dailyStepGoal": 8000,
-        "stepGoalDistance": 10000,
-        "totalDistance": 7500,
-        "wellnessDistanceUnit": "meter"
-    }
+    return copy.deepcopy(MOCK_STEPS_DATA)
 
 
 @pytest.fixture
 def sample_sleep_data():
     """Sample sleep data matching Garmin API response format"""
-    return {
-        "dailySleepDTO": {
-            "sleepTimeSeconds": 28800,  # 8 hours
-            "napTimeSeconds": 0,
-            "sleepStartTimestampGMT": 1705276800000,
-            "sleepEndTimestampGMT": 1705305600000,
-            "deepSleepSeconds": 7200,
-            "lightSleepSeconds": 14400,
-            "remSleepSeconds": 7200,
-            "awakeSleepSeconds": 0,
-            "awakeCount": 2,
-            "restlessMomentsCount": 15,
-            "avgSleepStress": 15,
-            "restingHeartRate": 55,
-            "sleepScores": {
-                "overall": {
-                    "value": 85,
-                    "qualifierKey": "GOOD",
-                    "optimalStart": 75,
-                    "optimalEnd": 100
-                }
-            }
-        },
-        "wellnessSpO2SleepSummaryDTO": {
-            "averageSpo2": 96,
-            "lowestSpo2": 93
-        },
-        "avgOvernightHrv": 45
-    }
+    return copy.deepcopy(MOCK_SLEEP_DATA)
 
 
 @pytest.fixture
 def sample_heart_rate_data():
     """Sample heart rate data matching Garmin API response format"""
-    return {
-        "restingHeartRate": 55,
-        "maxHeartRate": 180,
-        "minHeartRate": 45,
-        "lastSevenDaysAvgRestingHeartRate": 57
-    }
+    return copy.deepcopy(MOCK_HEART_RATES)
 
 
 @pytest.fixture
 def sample_body_battery_data():
     """Sample body battery data matching Garmin API response format"""
-    return [{
-        "startTimestampGMT": 1705276800000,
-        "endTimestampGMT": 1705363200000,
-        "chargedValue": 100,
-        "drainedValue": 25,
-        "bodyBatteryMostRecentValue": 75
-    }]
+    return copy.deepcopy(MOCK_BODY_BATTERY)
 
 
 @pytest.fixture
 def sample_training_status():
     """Sample training status data matching Garmin API response format"""
-    return {
-        "trainingStatusKey": "PRODUCTIVE",
-        "load7Day": 250,
-        "load4Week": 1000,
-        "vo2MaxValue": 52.5,
-        "fitnessAge": 25
-    }
+    return copy.deepcopy(MOCK_TRAINING_STATUS)
 
 
 def create_test_app(module, mock_client):
@@ -4,9 +4,12 @@ Integration tests for nutrition module MCP tools
 Tests tools from:
 - nutrition (8 tools: 5 read + 2 write + 1 metadata)
 """
+import asyncio
 import json
+import threading
 import pytest
 from unittest.mock import Mock
+from garminconnect import GarminConnectConnectionError
 from mcp.server.fastmcp import FastMCP
 
 from garmin_mcp import nutrition
@@ -16,6 +19,8 @@ from garmin_mcp import nutrition
 def app_with_nutrition(mock_garmin_client):
     """Create FastMCP app with nutrition tools registered"""
     nutrition.configure(mock_garmin_client)
+    # configure() keeps the read cache when handed the same (shared) client
+    nutrition.invalidate_response_cache()
     app = FastMCP("Test Nutrition")
     app = nutrition.register_tools(app)
     return app
@@ -70,6 +75,100 @@ async def test_get_nutrition_daily_food_log_error(app_with_nutrition, mock_garmi
     assert "Error retrieving food log data" in result[0][0].text
 
 
+@pytest.mark.asyncio
+async def test_get_nutrition_daily_food_log_invalid_date(app_with_nutrition, mock_garmin_client):
+    """Test get_nutrition_daily_food_log rejects a malformed date without calling the API"""
+    result = await app_with_nutrition.call_tool(
+        "get_nutrition_daily_food_log",
+        {"date": "2024-01-15/../../userprofile-service"}
+    )
+    assert "Invalid date" in result[0][0].text
+    mock_garmin_client.connectapi.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_nutrition_daily_food_log_cached(app_with_nutrition, mock_garmin_client):
+    """Test repeated food log reads for the same date reuse the cached response"""
+    mock_garmin_client.connectapi.return_value = {"foodLogEntries": [], "totalCalories": 0}
+    for _ in range(2):
+        await app_with_nutrition.call_tool(
+            "get_nutrition_daily_food_log",
+            {"date": "2024-01-15"}
+        )
+    mock_garmin_client.connectapi.assert_called_once_with("/nutrition-service/food/logs/2024-01-15")
+
+
+@pytest.mark.asyncio
+async def test_get_nutrition_daily_food_log_cache_cleared_by_write(app_with_nutrition, mock_garmin_client):
+    """Test a write through the module invalidates cached reads"""
+    mock_garmin_client.connectapi.return_value = {"foodLogEntries": [], "totalCalories": 0}
+    await app_with_nutrition.call_tool(
+        "get_nutrition_daily_food_log",
+        {"date": "2024-01-15"}
+    )
+    await app_with_nutrition.call_tool(
+        "delete_food_log",
+        {"log_id": "abc123", "meal_date": "2024-01-15"}
+    )
+    await app_with_nutrition.call_tool(
+        "get_nutrition_daily_food_log",
+        {"date": "2024-01-15"}
+    )
+    assert mock_garmin_client.connectapi.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_read_overlapping_write_is_not_cached(app_with_nutrition, mock_garmin_client):
+    """Test a read in flight during a write does not cache its pre-write response"""
+    fetching = threading.Event()
+    release = threading.Event()
+
+    def connectapi(url):
+        fetching.set()
+        release.wait(5)
+        return {"foodLogEntries": [{"logId": "abc123"}]}
+
+    mock_garmin_client.connectapi.side_effect = connectapi
+    read = asyncio.create_task(app_with_nutrition.call_tool(
+        "get_nutrition_daily_food_log",
+        {"date": "2024-01-15"}
+    ))
+    assert await asyncio.to_thread(fetching.wait, 5)
+    await app_with_nutrition.call_tool(
+        "delete_food_log",
+        {"log_id": "abc123", "meal_date": "2024-01-15"}
+    )
+    release.set()
+    await read
+
+    mock_garmin_client.connectapi.side_effect = None
+    mock_garmin_client.connectapi.return_value = {"foodLogEntries": []}
+    result = await app_with_nutrition.call_tool(
+        "get_nutrition_daily_food_log",
+        {"date": "2024-01-15"}
+    )
+    assert mock_garmin_client.connectapi.call_count == 2
+    assert "abc123" not in result[0][0].text
+
+
+@pytest.mark.asyncio
+async def test_nutrition_reads_do_not_block_event_loop(app_with_nutrition, mock_garmin_client):
+    """Test concurrent tool calls overlap instead of serializing on the event loop"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def connectapi(url):
+        barrier.wait()  # only released if both calls are in flight at once
+        return {"foodLogEntries": []}
+
+    mock_garmin_client.connectapi.side_effect = connectapi
+    results = await asyncio.gather(
+        app_with_nutrition.call_tool("get_nutrition_daily_food_log", {"date": "2024-01-15"}),
+        app_with_nutrition.call_tool("get_nutrition_daily_food_log", {"date": "2024-01-16"}),
+    )
+    for result in results:
+        assert "Error" not in result[0][0].text
+
+
 # get_nutrition_daily_meals tests
 
 @pytest.mark.asyncio
@@ -173,7 +272,7 @@ async def test_get_custom_foods(app_with_nutrition, mock_garmin_client):
     result = await app_with_nutrition.call_tool("get_custom_foods", {})
     assert result is not None
     mock_garmin_client.connectapi.assert_called_once_with(
-        "/nutrition-service/customFood?searchExpression=&start=0&limit=20&includeContent=true"
+        "/nutrition-service/customFood?start=0&limit=20&includeContent=true"
     )
 
 
@@ -191,6 +290,16 @@ async def test_get_custom_foods_with_search(app_with_nutrition, mock_garmin_clie
     )
 
 
+@pytest.mark.asyncio
+async def test_get_custom_foods_search_is_escaped(app_with_nutrition, mock_garmin_client):
+    """Test get_custom_foods escapes query-string delimiters in the search term"""
+    mock_garmin_client.connectapi.return_value = []
+    await app_with_nutrition.call_tool("get_custom_foods", {"search": "mac & cheese"})
+    mock_garmin_client.connectapi.assert_called_once_with(
+        "/nutrition-service/customFood?searchExpression=mac%20%26%20cheese&start=0&limit=20&includeContent=true"
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_custom_foods_empty(app_with_nutrition, mock_garmin_client):
     """Test get_custom_foods tool with no results"""
@@ -286,6 +395,31 @@ async def test_create_custom_food_error(app_with_nutrition, mock_garmin_client):
     assert "Error creating custom food" in result[0][0].text
 
 
+@pytest.mark.asyncio
+async def test_create_custom_food_connection_error_includes_body(app_with_nutrition, mock_garmin_client):
+    """Test create_custom_food surfaces the HTTP response body of a connection error"""
+    err = GarminConnectConnectionError("400 Bad Request")
+    err.error = Mock()
+    err.error.response.text = '{"message": "invalid serving unit"}'
+    mock_garmin_client.client.put.side_effect = err
+    result = await app_with_nutrition.call_tool(
+        "create_custom_food",
+        {"food_name": "Test", "calories": 100}
+    )
+    assert "invalid serving unit" in result[0][0].text
+
+
+@pytest.mark.asyncio
+async def test_create_custom_food_connection_error_without_body(app_with_nutrition, mock_garmin_client):
+    """Test create_custom_food tolerates connection errors with no wrapped response"""
+    mock_garmin_client.client.put.side_effect = GarminConnectConnectionError("timeout")
+    result = await app_with_nutrition.call_tool(
+        "create_custom_food",
+        {"food_name": "Test", "calories": 100}
+    )
+    assert result[0][0].text == "Error creating custom food: timeout | Response: "
+
+
 # update_custom_food tests
 
 @pytest.mark.asyncio
@@ -383,6 +517,22 @@ async def test_create_custom_food_with_brand_and_micros(app_with_nutrition, mock
     assert nc["vitaminD"] == "2.5"
 
 
+@pytest.mark.parametrize("tool", ["create_custom_food", "update_custom_food"])
+@pytest.mark.asyncio
+async def test_custom_food_forwards_every_nutrient(app_with_nutrition, mock_garmin_client, tool):
+    """Every optional nutrient parameter reaches its API field"""
+    mock_garmin_client.connectapi.return_value = {"customFoods": []}
+    mock_garmin_client.client.put.return_value = {}
+    nutrients = {name: i + 1 for i, (_, name) in enumerate(nutrition._OPTIONAL_NUTRIENT_FIELDS)}
+    args = {"food_name": "Full Label", "calories": 100, **nutrients}
+    if tool == "update_custom_food":
+        args.update(food_id="abc123", serving_id="srv456")
+    await app_with_nutrition.call_tool(tool, args)
+    nc = mock_garmin_client.client.put.call_args[1]["json"]["nutritionContents"][0]
+    for api_key, name in nutrition._OPTIONAL_NUTRIENT_FIELDS:
+        assert nc[api_key] == str(nutrients[name])
+
+
 @pytest.mark.asyncio
 async def test_create_custom_food_minimal_no_brand(app_with_nutrition, mock_garmin_client):
     """brand_name absent → brandName key must not appear in foodMetaData"""
@@ -633,6 +783,23 @@ async def test_log_custom_food(app_with_nutrition, mock_garmin_client):
     assert item["mealTime"] == "12:30:00"
 
 
+@pytest.mark.asyncio
+async def test_log_custom_food_invalid_meal_date(app_with_nutrition, mock_garmin_client):
+    """Test log_custom_food rejects a malformed meal_date before any API call"""
+    result = await app_with_nutrition.call_tool(
+        "log_custom_food",
+        {
+            "meal_date": "15/01/2024",
+            "meal_time": "12:30:00",
+            "food_id": "abc123",
+            "serving_id": "srv456",
+        }
+    )
+    assert "Invalid meal_date" in result[0][0].text
+    mock_garmin_client.connectapi.assert_not_called()
+    mock_garmin_client.client.put.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_log_custom_food_falls_back_to_snacks(app_with_nutrition, mock_garmin_client):
     """Test log_custom_food falls back to SNACKS when time doesn't match any window"""
@@ -670,6 +837,51 @@ async def test_log_custom_food_error(app_with_nutrition, mock_garmin_client):
     assert "Error logging food" in result[0][0].text
 
 
+# log_custom_foods tests
+
+@pytest.mark.asyncio
+async def test_log_custom_foods(app_with_nutrition, mock_garmin_client):
+    """Test log_custom_foods sends every item in one PUT"""
+    mock_garmin_client.connectapi.return_value = MOCK_MEALS
+    mock_garmin_client.client.put.return_value = {}
+    result = await app_with_nutrition.call_tool(
+        "log_custom_foods",
+        {
+            "meal_date": "2024-01-15",
+            "meal_time": "12:30:00",  # within LUNCH window 11:00-14:00
+            "foods": [
+                {"food_id": "abc123", "serving_id": "srv456"},
+                {"food_id": "def789", "serving_id": "srv012", "serving_qty": 2},
+            ],
+        }
+    )
+    assert "Logged 2 food items successfully" in result[0][0].text
+    mock_garmin_client.client.put.assert_called_once()
+    call_args = mock_garmin_client.client.put.call_args
+    assert call_args[0][1] == "/nutrition-service/food/logs"
+    items = call_args[1]["json"]["foodLogItems"]
+    assert [item["foodId"] for item in items] == ["abc123", "def789"]
+    assert [item["servingQty"] for item in items] == [1, 2]
+    assert all(item["mealId"] == 20250 for item in items)  # LUNCH
+    assert all(item["logCategory"] == "REGULAR_LOG" for item in items)
+
+
+@pytest.mark.asyncio
+async def test_log_custom_foods_rejects_incomplete_items(app_with_nutrition, mock_garmin_client):
+    """Test log_custom_foods validates items before calling the API"""
+    result = await app_with_nutrition.call_tool(
+        "log_custom_foods",
+        {
+            "meal_date": "2024-01-15",
+            "meal_time": "12:30:00",
+            "foods": [{"food_id": "abc123", "serving_id": "srv456"}, {"food_id": "def789"}],
+        }
+    )
+    assert "items [1] are missing food_id or serving_id" in result[0][0].text
+    mock_garmin_client.connectapi.assert_not_called()
+    mock_garmin_client.client.put.assert_not_called()
+
+
 # delete_custom_food tests
 
 @pytest.mark.asyncio
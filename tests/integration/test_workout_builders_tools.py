@@ -8,6 +8,7 @@ from mcp.server.fastmcp import FastMCP
 from unittest.mock import MagicMock
 
 from garmin_mcp import workouts, workout_builders
+from tests.fixtures.garmin_responses import MOCK_WORKOUTS
 
 
 @pytest.fixture
@@ -30,6 +31,72 @@ def app_with_builders(mock_garmin_client):
     return app
 
 
+@pytest.fixture
+def app_with_builders_and_workouts(app_with_builders):
+    """App with both workout_builders and workouts tools registered"""
+    return workouts.register_tools(app_with_builders)
+
+
+@pytest.mark.asyncio
+async def test_builder_upload_invalidates_cached_workout_list(
+    app_with_builders_and_workouts, mock_garmin_client
+):
+    """A workout built and uploaded here must show up in the next get_workouts"""
+    app = app_with_builders_and_workouts
+    mock_garmin_client.get_workouts.return_value = MOCK_WORKOUTS
+    mock_garmin_client.upload_workout.return_value = {
+        "workoutId": 42, "workoutName": "Z2 Walk"
+    }
+
+    first = json.loads((await app.call_tool("get_workouts", {}))[0][0].text)
+    await app.call_tool(
+        "create_z2_walk_workout",
+        {"name": "Z2 Walk", "duration_min": 45, "hr_min": 100, "hr_max": 120},
+    )
+    mock_garmin_client.get_workouts.return_value = MOCK_WORKOUTS + [
+        {"workoutId": 42, "workoutName": "Z2 Walk"}
+    ]
+    second = json.loads((await app.call_tool("get_workouts", {}))[0][0].text)
+
+    assert first["count"] == 1
+    assert second["count"] == 2
+    assert mock_garmin_client.get_workouts.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_schedule_week_invalidates_cached_schedule(
+    app_with_builders_and_workouts, mock_garmin_client
+):
+    """A workout scheduled by schedule_week must show up in get_scheduled_workouts"""
+    app = app_with_builders_and_workouts
+    args = {"start_date": "2026-05-11", "end_date": "2026-05-17"}
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_garmin_client.client.post.return_value = mock_response
+
+    existing = {"scheduleDate": "2026-05-11", "workoutId": 111, "workoutName": "Swim"}
+    mock_garmin_client.query_garmin_graphql.return_value = {
+        "data": {"workoutScheduleSummariesScalar": [existing]}
+    }
+
+    first = json.loads((await app.call_tool("get_scheduled_workouts", args))[0][0].text)
+    await app.call_tool(
+        "schedule_week",
+        {"week": [{"date": "2026-05-12", "workout_id": 1234567890}]},
+    )
+    mock_garmin_client.query_garmin_graphql.return_value = {
+        "data": {"workoutScheduleSummariesScalar": [
+            existing,
+            {"scheduleDate": "2026-05-12", "workoutId": 1234567890, "workoutName": "Run"},
+        ]}
+    }
+    second = json.loads((await app.call_tool("get_scheduled_workouts", args))[0][0].text)
+
+    assert first["count"] == 1
+    assert second["count"] == 2
+    assert second["scheduled_workouts"][1]["workout_id"] == 1234567890
+
+
 @pytest.mark.asyncio
 async def test_schedule_week_uses_client_post_not_garth(
     app_with_builders, mock_garmin_client
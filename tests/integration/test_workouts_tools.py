@@ -73,6 +73,30 @@ async def test_get_workouts_tool(app_with_workouts, mock_garmin_client):
     mock_garmin_client.get_workouts.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_workouts_tool_cached(app_with_workouts, mock_garmin_client):
+    """Test repeated get_workouts calls reuse the cached response"""
+    mock_garmin_client.get_workouts.return_value = MOCK_WORKOUTS
+
+    first = await app_with_workouts.call_tool("get_workouts", {})
+    second = await app_with_workouts.call_tool("get_workouts", {})
+
+    assert first[0][0].text == second[0][0].text
+    mock_garmin_client.get_workouts.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_workouts_tool_cache_cleared_by_write(app_with_workouts, mock_garmin_client):
+    """Test a workout write invalidates the cached workout list"""
+    mock_garmin_client.get_workouts.return_value = MOCK_WORKOUTS
+
+    await app_with_workouts.call_tool("get_workouts", {})
+    await app_with_workouts.call_tool("delete_workout", {"workout_id": 123456})
+    await app_with_workouts.call_tool("get_workouts", {})
+
+    assert mock_garmin_client.get_workouts.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_workout_by_id_tool(app_with_workouts, mock_garmin_client):
     """Test get_workout_by_id tool returns specific workout with step details (numeric ID)"""
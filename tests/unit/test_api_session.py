@@ -0,0 +1,37 @@
+"""Unit tests for _reuse_api_session: pooled HTTP session for API calls."""
+
+from unittest.mock import Mock
+
+import requests
+from garminconnect import Garmin
+
+from garmin_mcp import _reuse_api_session
+
+
+class TestReuseApiSession:
+    """Tests for _reuse_api_session."""
+
+    def test_api_calls_share_one_session(self):
+        garmin = Garmin()
+        _reuse_api_session(garmin)
+        first = garmin.client._fresh_api_session()
+        assert isinstance(first, requests.Session)
+        assert garmin.client._fresh_api_session() is first
+
+    def test_session_pool_and_retries(self):
+        garmin = Garmin()
+        _reuse_api_session(garmin)
+        adapter = garmin.client._fresh_api_session().get_adapter("https://connectapi.garmin.com")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
+        assert "PUT" not in adapter.max_retries.allowed_methods
+
+    def test_session_does_not_keep_cookies(self):
+        garmin = Garmin()
+        _reuse_api_session(garmin)
+        policy = garmin.client._fresh_api_session().cookies._policy
+        assert policy.is_not_allowed("connectapi.garmin.com")
+
+    def test_unknown_client_is_left_alone(self):
+        garmin = Mock(spec=[])
+        _reuse_api_session(garmin)  # no client attribute; must not raise
@@ -0,0 +1,22 @@
+"""Unit tests for the shared mock_garmin_client fixture's per-test reset.
+
+The tests in this module run in order: the first one replaces child mocks,
+the next ones check that those replacements did not leak.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+
+class TestMockGarminClientReset:
+    """Tests for the mock_garmin_client fixture."""
+
+    def test_replace_children(self, mock_garmin_client):
+        mock_garmin_client.get_workouts = AsyncMock(return_value=[])
+        mock_garmin_client.get_activities = Mock(return_value=["stale"])
+
+    def test_replaced_children_do_not_leak(self, mock_garmin_client):
+        assert not isinstance(mock_garmin_client.get_workouts, AsyncMock)
+        assert mock_garmin_client.get_activities() == []
+
+    def test_spec_still_enforced(self, mock_garmin_client):
+        assert not hasattr(mock_garmin_client, "not_a_garmin_method")
@@ -0,0 +1,55 @@
+"""Unit tests for TTLCache: short-lived cache for tool read responses."""
+
+from unittest.mock import patch
+
+from garmin_mcp.response_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_returns_cached_value(self):
+        cache = TTLCache(ttl=10, max_entries=4)
+        assert cache.put("k", {"a": 1}) == {"a": 1}
+        assert cache.get("k") == {"a": 1}
+
+    def test_missing_key(self):
+        assert TTLCache(ttl=10, max_entries=4).get("k") is None
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=10, max_entries=4)
+        with patch("garmin_mcp.response_cache.time.monotonic", return_value=100):
+            cache.put("short", 1, ttl=5)
+            cache.put("default", 2)
+        with patch("garmin_mcp.response_cache.time.monotonic", return_value=106):
+            assert cache.get("short") is None
+            assert cache.get("default") == 2
+        with patch("garmin_mcp.response_cache.time.monotonic", return_value=111):
+            assert cache.get("default") is None
+
+    def test_full_cache_is_emptied(self):
+        cache = TTLCache(ttl=10, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        cache = TTLCache(ttl=10, max_entries=4)
+        cache.put("k", 1)
+        cache.clear()
+        assert cache.get("k") is None
+
+    def test_put_skipped_after_clear(self):
+        cache = TTLCache(ttl=10, max_entries=4)
+        generation = cache.generation
+        cache.clear()
+        assert cache.put("k", 1, generation=generation) == 1
+        assert cache.get("k") is None
+
+    def test_put_kept_without_clear(self):
+        cache = TTLCache(ttl=10, max_entries=4)
+        cache.put("k", 1, generation=cache.generation)
+        assert cache.get("k") == 1
@@ -0,0 +1,59 @@
+"""Unit tests for serialization module."""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from garmin_mcp import serialization
+from garmin_mcp.serialization import to_json
+
+SAMPLE = {"meals": [{"mealId": 1, "calories": 105.5, "name": "Café"}], "ok": True, "note": None}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request):
+    """Run a test against both the orjson and the stdlib encoder paths."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield request.param
+    else:
+        with patch.object(serialization, "orjson", None):
+            yield request.param
+
+
+class TestToJson:
+    """Tests for to_json function."""
+
+    def test_round_trips_nested_data(self, encoder):
+        """Test that nested dicts and lists survive serialization."""
+        assert json.loads(to_json(SAMPLE)) == SAMPLE
+
+    def test_indented_output(self, encoder):
+        """Test that output is pretty-printed with 2-space indentation."""
+        assert to_json({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_non_ascii_preserved(self, encoder):
+        """Test that non-ASCII characters are written as-is, not escaped."""
+        assert to_json({"name": "Café"}) == '{\n  "name": "Café"\n}'
+
+    def test_non_str_keys(self, encoder):
+        """Test that integer keys are serialized as strings."""
+        assert json.loads(to_json({1: "x"})) == {"1": "x"}
+
+    def test_unsupported_type_raises(self, encoder):
+        """Test that values that are not plain JSON data raise TypeError."""
+        with pytest.raises(TypeError):
+            to_json({"day": date(2024, 1, 15)})
+
+    def test_large_int_falls_back_to_stdlib(self, encoder):
+        """Test that integers orjson cannot encode still serialize."""
+        assert json.loads(to_json({"n": 2**70})) == {"n": 2**70}
+
+    def test_encoders_agree(self):
+        """Test that both paths produce byte-identical output."""
+        pytest.importorskip("orjson")
+        fast = to_json(SAMPLE)
+        with patch.object(serialization, "orjson", None):
+            assert to_json(SAMPLE) == fast
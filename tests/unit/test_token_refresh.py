@@ -0,0 +1,70 @@
+"""Unit tests for _serialize_token_refresh: one auth refresh at a time."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, PropertyMock, patch
+
+from garminconnect import Garmin
+
+from garmin_mcp import _serialize_token_refresh
+
+
+def _client_with_expiring_token():
+    """Garmin client whose token expires soon and whose refresh is slow."""
+    garmin = Garmin()
+    client = garmin.client
+    state = {"expiring": True, "refreshes": 0, "active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def slow_refresh():
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.1)
+        with lock:
+            state["refreshes"] += 1
+            state["expiring"] = False
+            state["active"] -= 1
+
+    client._refresh_session = slow_refresh
+    client._token_expires_soon = lambda: state["expiring"]
+    client.get_api_headers = lambda: {}
+    session = Mock()
+    session.request.return_value = Mock(status_code=200)
+    client._fresh_api_session = lambda: session
+    return garmin, state
+
+
+class TestSerializeTokenRefresh:
+    """Tests for _serialize_token_refresh."""
+
+    def _run_concurrently(self, garmin, calls=2):
+        barrier = threading.Barrier(calls)
+
+        def call():
+            barrier.wait()
+            return garmin.client._run_request("GET", "/userprofile-service/socialProfile")
+
+        with patch.object(type(garmin.client), "is_authenticated", new_callable=PropertyMock, return_value=True):
+            with ThreadPoolExecutor(max_workers=calls) as pool:
+                return [f.result() for f in [pool.submit(call) for _ in range(calls)]]
+
+    def test_concurrent_calls_refresh_once(self):
+        garmin, state = _client_with_expiring_token()
+        _serialize_token_refresh(garmin)
+        results = self._run_concurrently(garmin)
+        assert all(r.status_code == 200 for r in results)
+        assert state["refreshes"] == 1
+        assert state["max_active"] == 1
+
+    def test_sequential_refreshes_still_run(self):
+        garmin, state = _client_with_expiring_token()
+        _serialize_token_refresh(garmin)
+        garmin.client._refresh_session()
+        garmin.client._refresh_session()
+        assert state["refreshes"] == 2
+
+    def test_unknown_client_is_left_alone(self):
+        garmin = Mock(spec=[])
+        _serialize_token_refresh(garmin)  # no client attribute; must not raise